@@ -3,24 +3,35 @@ Trading Economics Commodities Scraper
 Parses commodities data from tradingeconomics.com using class-based architecture
 """
 
+import logging
+import sys
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
 import pandas as pd
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+import numpy as np
+from typing import List, Dict, Optional, NamedTuple, Union
+from dataclasses import dataclass, field
 import re
-from datetime import datetime, date
+from datetime import date, timedelta
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, errorcode
+from sqlalchemy import create_engine
+from sqlalchemy.engine import URL
+from sqlalchemy.exc import SQLAlchemyError
 import smtplib
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from abc import ABC, abstractmethod
 
 
-@dataclass
-class Commodity:
-    """Data class representing a single commodity entry"""
+logger = logging.getLogger(__name__)
+
+
+class Commodity(NamedTuple):
+    """Immutable record representing a single commodity entry"""
     asset: str
     name: str
     unit: str
@@ -42,42 +53,69 @@ class WebScraper:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        
+        # Reuse one keep-alive connection pool across fetches and retry transient failures
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def fetch_page(self) -> Optional[str]:
         """Fetch the webpage content"""
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=10)
+            response = self.session.get(self.url, timeout=10)
             response.raise_for_status()
+            # The site serves UTF-8; without a declared charset requests would guess
+            # (ISO-8859-1 for text/*, chardet detection otherwise)
+            if 'charset' not in response.headers.get('Content-Type', '').lower():
+                response.encoding = 'utf-8'
             return response.text
         except requests.RequestException as e:
-            print(f"Error fetching page: {e}")
+            logger.error("Error fetching page: %s", e)
             return None
+    
+    def close(self):
+        """Close pooled HTTP connections"""
+        self.session.close()
 
 
 class TableParser:
     """Parses HTML tables and extracts commodities data"""
     
-    def __init__(self, html_content: str):
-        self.soup = BeautifulSoup(html_content, 'html.parser')
+    # Translation tables used to clean numeric cells in a single pass
+    _NUMBER_STRIP = str.maketrans('', '', ', ')
+    _PERCENT_STRIP = str.maketrans('', '', '% ')
+    _MONTHS = {
+        'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+        'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+    }
+    
+    def __init__(self, html_content: Union[str, bytes]):
+        # Parse with lxml directly; the tree is built and walked in C. Text is parsed as is
+        # and bytes are decoded by lxml from the page's declared charset
+        self.tree = lxml.html.fromstring(html_content)
         self.commodities: List[Commodity] = []
         self.current_asset_category = "Unknown"
     
     def parse_tables(self) -> List[Commodity]:
         """Parse all commodity tables from the page"""
-        # Find all table rows
-        rows = self.soup.find_all('tr')
-        
-        for row in rows:
+        # Walk all table rows
+        for row in self.tree.iter('tr'):
             # Check if this row is a header row (category name)
-            header = row.find('th')
-            if header:
-                header_text = header.get_text(strip=True)
+            header = row.find('.//th')
+            if header is not None:
+                header_text = self._cell_text(header)
                 if header_text and header_text not in ['Price', 'Day', '%', 'Week', 'Month', 'Year', '3Y']:
                     # This is a category header (Energy, Metals, etc.)
                     self.current_asset_category = header_text
                 continue
             
-            cols = row.find_all('td')
+            cols = row.findall('.//td')
             if len(cols) >= 8:  # Valid commodity row
                 try:
                     commodity = self._parse_row(cols, self.current_asset_category)
@@ -93,7 +131,7 @@ class TableParser:
         """Parse a single table row into a Commodity object"""
         try:
             # Extract text from cells
-            cell_texts = [col.get_text(strip=True) for col in cols]
+            cell_texts = [self._cell_text(col) for col in cols]
             
             # First cell contains name and unit (possibly on separate lines)
             name_unit_cell = cols[0]
@@ -126,26 +164,25 @@ class TableParser:
         except Exception:
             return None
     
+    @staticmethod
+    def _cell_text(cell) -> str:
+        """Join the stripped text nodes of a cell"""
+        return ''.join(text.strip() for text in cell.itertext())
+    
     @staticmethod
     def _split_name_unit_from_cell(cell) -> tuple:
         """Split commodity name and unit from table cell"""
         # The cell contains name and unit, possibly in separate elements or lines
-        # Try to find separate text elements within the cell
-        text_elements = cell.find_all(text=True, recursive=True)
-        clean_elements = [elem.strip() for elem in text_elements if elem.strip()]
+        # Collect its non-blank text nodes in a single walk
+        parts = [text for text in map(str.strip, cell.itertext()) if text]
         
-        if len(clean_elements) >= 2:
+        if len(parts) >= 2:
             # Name is typically first, unit is second
-            name = clean_elements[0]
-            unit = clean_elements[1]
-            return name, unit
-        elif len(clean_elements) == 1:
+            return parts[0], parts[1]
+        elif parts:
             # Fall back to splitting single text
-            text = clean_elements[0]
-            parts = text.rsplit(' ', 1)
-            if len(parts) == 2:
-                return parts[0], parts[1]
-            return text, ""
+            name, sep, unit = parts[0].rpartition(' ')
+            return (name, unit) if sep else (parts[0], "")
         else:
             return "", ""
     
@@ -162,9 +199,14 @@ class TableParser:
     def _parse_number(text: str) -> float:
         """Parse numeric value, handling commas and special cases"""
         try:
-            # Remove commas and whitespace
-            cleaned = text.replace(',', '').replace(' ', '').strip()
-            return float(cleaned)
+            # Fast path: most cells are already plain numbers
+            return float(text)
+        except ValueError:
+            pass
+        
+        try:
+            # Remove commas and spaces; float() ignores surrounding whitespace
+            return float(text.translate(TableParser._NUMBER_STRIP))
         except ValueError:
             return 0.0
     
@@ -172,8 +214,14 @@ class TableParser:
     def _parse_percentage(text: str) -> float:
         """Parse percentage value"""
         try:
-            # Remove % sign and whitespace
-            cleaned = text.replace('%', '').replace(' ', '').strip()
+            # Fast path: a plain "1.23%" cell only needs the trailing sign dropped
+            return float(text[:-1] if text.endswith('%') else text)
+        except ValueError:
+            pass
+        
+        try:
+            # Remove % sign and spaces
+            cleaned = text.translate(TableParser._PERCENT_STRIP)
             if cleaned == '' or cleaned == '-':
                 return 0.0
             return float(cleaned)
@@ -181,6 +229,7 @@ class TableParser:
             return 0.0
     
     @staticmethod
+    @lru_cache(maxsize=512)
     def _parse_date(date_str: str) -> str:
         """Parse date from format like 'Nov/28' to 'yyyy/mm/dd'"""
         if not date_str or date_str.strip() == '':
@@ -196,9 +245,9 @@ class TableParser:
                 # Use current year (2025)
                 year = 2025
                 
-                # Parse month name
-                date_obj = datetime.strptime(f"{month_str} {day_str} {year}", "%b %d %Y")
-                return date_obj.strftime("%Y/%m/%d")
+                # Look up the month abbreviation directly instead of going through strptime
+                month = TableParser._MONTHS[month_str.strip().lower()]
+                return date(year, month, int(day_str)).strftime("%Y/%m/%d")
             else:
                 return date_str
         except Exception:
@@ -208,29 +257,31 @@ class TableParser:
 class CommodityDataManager:
     """Manages commodity data and provides analysis functionality"""
     
+    # DataFrame columns in Commodity field order; text stays as Python objects
+    _RECORD_DTYPE = np.dtype([
+        ('Asset', object), ('Name', object), ('Unit', object),
+        ('Price', np.float64), ('Change', np.float64),
+        ('Daily %', np.float64), ('Weekly %', np.float64), ('Monthly %', np.float64),
+        ('Yearly %', np.float64), ('3-Year %', np.float64),
+        ('Date', object)
+    ])
+    
     def __init__(self, commodities: List[Commodity]):
         self.commodities = commodities
         self.df = self._create_dataframe()
+        self._name_lower: Optional[pd.Series] = None
     
     def _create_dataframe(self) -> pd.DataFrame:
         """Convert commodities list to pandas DataFrame"""
-        data = [
-            {
-                'Asset': c.asset,
-                'Name': c.name,
-                'Unit': c.unit,
-                'Price': c.price,
-                'Change': c.change,
-                'Daily %': c.daily_pct,
-                'Weekly %': c.weekly_pct,
-                'Monthly %': c.monthly_pct,
-                'Yearly %': c.yearly_pct,
-                '3-Year %': c.three_year_pct,
-                'Date': c.date
-            }
-            for c in self.commodities
-        ]
-        return pd.DataFrame(data)
+        # Commodity is a tuple, so the list loads straight into a structured array whose
+        # float64 fields become typed columns without per-row inference
+        records = np.array(self.commodities, dtype=self._RECORD_DTYPE)
+        df = pd.DataFrame.from_records(records)
+        
+        # Asset has only a handful of values, so store it as a categorical (compact codes for grouping)
+        df['Asset'] = df['Asset'].astype('category')
+        df['Name'] = df['Name'].astype('string')
+        return df
     
     def get_columns(self) -> List[str]:
         """Return list of column names"""
@@ -254,7 +305,14 @@ class CommodityDataManager:
     
     def filter_by_category(self, keyword: str) -> pd.DataFrame:
         """Filter commodities by name keyword"""
-        mask = self.df['Name'].str.contains(keyword, case=False, na=False)
+        if re.escape(keyword) != keyword:
+            # Keep regex semantics for patterns
+            mask = self.df['Name'].str.contains(keyword, case=False, na=False)
+        else:
+            # Plain keywords use a substring search on names lowercased once per manager
+            if self._name_lower is None:
+                self._name_lower = self.df['Name'].str.lower()
+            mask = self._name_lower.str.contains(keyword.lower(), regex=False, na=False)
         return self.df[mask]
     
     def get_top_performers(self, period: str = 'Daily %', n: int = 10) -> pd.DataFrame:
@@ -263,174 +321,144 @@ class CommodityDataManager:
     
     def get_top_by_category(self, period: str = 'Daily %', n: int = 5) -> pd.DataFrame:
         """Get top n performers from each asset category"""
-        result_frames = []
-        
-        # Get unique categories
-        categories = self.df['Asset'].unique()
-        
-        for category in categories:
-            # Filter by category
-            category_df = self.df[self.df['Asset'] == category]
-            # Get top n from this category
-            top_n = category_df.nlargest(n, period)[['Asset', 'Name', 'Unit', 'Price', 'Change', period, 'Date']]
-            result_frames.append(top_n)
-        
-        # Combine all results
-        if result_frames:
-            return pd.concat(result_frames, ignore_index=True)
-        return pd.DataFrame()
+        columns = ['Asset', 'Name', 'Unit', 'Price', 'Change', period, 'Date']
+        return self._top_n_per_asset(self.df, period, n)[columns].reset_index(drop=True)
+    
+    @staticmethod
+    def _top_n_per_asset(df: pd.DataFrame, period: str, n: int) -> pd.DataFrame:
+        """Top n rows by period within each asset, assets kept in order of first appearance"""
+        # One stable sort plus a grouped head replaces a filter and nlargest per category
+        ranked = df.assign(_asset_order=pd.factorize(df['Asset'])[0]).sort_values(
+            ['_asset_order', period], ascending=[True, False], kind='stable'
+        )
+        return ranked.groupby('_asset_order', sort=False).head(n).drop(columns='_asset_order')
     
     def get_strong_leads(self) -> pd.DataFrame:
         """Get commodities that appear in top 3 for any period (Daily, Weekly, Monthly, Yearly) within their category"""
-        result_frames = []
+        groups = self.df.groupby('Asset', sort=False, observed=True)
         
-        # Get unique categories
-        categories = self.df['Asset'].unique()
+        # Flag the periods each commodity is in its category's top 3 for, e.g. "2/4 (D,W)"
+        # rank(method='first') breaks ties by position, like nlargest(keep='first')
+        flags = pd.DataFrame({
+            code: groups[period].rank(method='first', ascending=False) <= 3
+            for code, period in (('D', 'Daily %'), ('W', 'Weekly %'), ('M', 'Monthly %'), ('Y', 'Yearly %'))
+        })
+        # Top 3 membership is by name, so rows repeating a name in a category share its flags
+        flags = flags.groupby(
+            [self.df['Asset'], self.df['Name']], sort=False, observed=True, dropna=False
+        ).transform('any')
         
-        for category in categories:
-            # Filter by category
-            category_df = self.df[self.df['Asset'] == category]
-            
-            if len(category_df) == 0:
-                continue
-            
-            # Get top 3 performers for each period
-            top3_daily = set(category_df.nlargest(3, 'Daily %')['Name'].values)
-            top3_weekly = set(category_df.nlargest(3, 'Weekly %')['Name'].values)
-            top3_monthly = set(category_df.nlargest(3, 'Monthly %')['Name'].values)
-            top3_yearly = set(category_df.nlargest(3, 'Yearly %')['Name'].values)
-            
-            # Union of all top 3 - any commodity in top 3 of ANY period qualifies
-            strong_leads = top3_daily | top3_weekly | top3_monthly | top3_yearly
-            
-            if strong_leads:
-                # Get details for all strong leads in this category
-                leads_df = category_df[category_df['Name'].isin(strong_leads)][
-                    ['Asset', 'Name', 'Unit', 'Price', 'Daily %', 'Weekly %', 'Monthly %', 'Yearly %', 'Date']
-                ].copy()
-                
-                # Count how many periods each commodity is in top 3
-                def count_top3_appearances(row):
-                    count = 0
-                    periods = []
-                    if row['Name'] in top3_daily:
-                        count += 1
-                        periods.append('D')
-                    if row['Name'] in top3_weekly:
-                        count += 1
-                        periods.append('W')
-                    if row['Name'] in top3_monthly:
-                        count += 1
-                        periods.append('M')
-                    if row['Name'] in top3_yearly:
-                        count += 1
-                        periods.append('Y')
-                    return f"{count}/4 ({','.join(periods)})"
-                
-                leads_df['Match'] = leads_df.apply(count_top3_appearances, axis=1)
-                
-                result_frames.append(leads_df)
+        # Union of all top 3 - any commodity in top 3 of ANY period qualifies
+        is_lead = flags.any(axis=1)
+        if not is_lead.any():
+            return pd.DataFrame()
         
-        # Combine all results
-        if result_frames:
-            combined_df = pd.concat(result_frames, ignore_index=True)
-            
-            # Add sort key for match count
-            combined_df['_match_count'] = combined_df['Match'].str.split('/').str[0].astype(int)
-            
-            # Sort differently based on match count
-            # For 1/4: sort by Daily %, then Weekly %
-            # For 2/4+: sort by Weekly %, then Monthly %
-            def sort_key(row):
-                if row['_match_count'] == 1:
-                    return (row['_match_count'], row['Daily %'], row['Weekly %'])
-                else:
-                    return (row['_match_count'], row['Weekly %'], row['Monthly %'])
-            
-            combined_df['_sort_tuple'] = combined_df.apply(sort_key, axis=1)
-            combined_df = combined_df.sort_values('_sort_tuple', ascending=False).drop(columns=['_match_count', '_sort_tuple'])
-            
-            # Add rank column (overall ranking)
-            combined_df.insert(0, 'Rank', range(1, len(combined_df) + 1))
-            
-            # Add rank within asset category
-            combined_df['Rank_Asset'] = combined_df.groupby('Asset').cumcount() + 1
-            combined_df.insert(1, 'Rank_Asset', combined_df.pop('Rank_Asset'))
-            
-            return combined_df
-        return pd.DataFrame()
+        flags = flags[is_lead].reset_index(drop=True)
+        combined_df = self.df.loc[
+            is_lead, ['Asset', 'Name', 'Unit', 'Price', 'Daily %', 'Weekly %', 'Monthly %', 'Yearly %', 'Date']
+        ].reset_index(drop=True)
+        match_count = flags.sum(axis=1)
+        tags = flags.dot(flags.columns + ',').str.rstrip(',')
+        combined_df['Match'] = match_count.astype(str) + '/4 (' + tags + ')'
+        
+        # Sort differently based on match count
+        # For 1/4: sort by Daily %, then Weekly %
+        # For 2/4+: sort by Weekly %, then Monthly %
+        single = match_count == 1
+        combined_df['_match_count'] = match_count
+        combined_df['_key1'] = np.where(single, combined_df['Daily %'], combined_df['Weekly %'])
+        combined_df['_key2'] = np.where(single, combined_df['Weekly %'], combined_df['Monthly %'])
+        combined_df = combined_df.sort_values(
+            ['_match_count', '_key1', '_key2'], ascending=False
+        ).drop(columns=['_match_count', '_key1', '_key2'])
+        
+        # Add rank column (overall ranking)
+        combined_df.insert(0, 'Rank', range(1, len(combined_df) + 1))
+        
+        # Add rank within asset category
+        combined_df['Rank_Asset'] = combined_df.groupby('Asset', observed=True).cumcount() + 1
+        combined_df.insert(1, 'Rank_Asset', combined_df.pop('Rank_Asset'))
+        
+        return combined_df
     
     def get_investment_opportunities(self) -> Dict[str, pd.DataFrame]:
         """Get best short-term, mid-term, and long-term investment opportunities by asset category"""
-        opportunities = {
-            'short_term': [],
-            'mid_term': [],
-            'long_term': []
-        }
+        df = self.df
+        daily_up = df['Daily %'] > 0
+        weekly_up = df['Weekly %'] > 0
+        monthly_up = df['Monthly %'] > 0
+        yearly_up = df['Yearly %'] > 0
         
-        # Get unique categories
-        categories = self.df['Asset'].unique()
+        # Short-term: Strong Daily % with positive Weekly % confirmation
+        # Look for high momentum right now
+        short_term = self._top_n_per_asset(df[daily_up & weekly_up], 'Daily %', 1)[
+            ['Asset', 'Name', 'Unit', 'Price', 'Daily %', 'Weekly %', 'Date']
+        ]
         
-        for category in categories:
-            # Filter by category
-            category_df = self.df[self.df['Asset'] == category]
-            
-            if len(category_df) == 0:
+        # Mid-term: Best Weekly % with positive Monthly % confirmation
+        # Look for sustained momentum over weeks
+        mid_term = self._top_n_per_asset(df[weekly_up & monthly_up], 'Weekly %', 1)[
+            ['Asset', 'Name', 'Unit', 'Price', 'Weekly %', 'Monthly %', 'Date']
+        ]
+        
+        # Long-term: Best Yearly % with positive Monthly % confirmation
+        # Look for strong long-term trends
+        long_term = self._top_n_per_asset(df[yearly_up & monthly_up], 'Yearly %', 1)[
+            ['Asset', 'Name', 'Unit', 'Price', 'Monthly %', 'Yearly %', 'Date']
+        ]
+        
+        # Label and rank each timeframe
+        result = {}
+        for timeframe, label, picks in (
+            ('short_term', 'Short-term', short_term),
+            ('mid_term', 'Mid-term', mid_term),
+            ('long_term', 'Long-term', long_term)
+        ):
+            if picks.empty:
+                result[timeframe] = pd.DataFrame()
                 continue
             
-            # Short-term: Strong Daily % with positive Weekly % confirmation
-            # Look for high momentum right now
-            short_term_candidates = category_df[
-                (category_df['Daily %'] > 0) & 
-                (category_df['Weekly %'] > 0)
-            ].nlargest(1, 'Daily %')[['Asset', 'Name', 'Unit', 'Price', 'Daily %', 'Weekly %', 'Date']].copy()
-            if not short_term_candidates.empty:
-                short_term_candidates['Timeframe'] = 'Short-term'
-                opportunities['short_term'].append(short_term_candidates)
+            picks = picks.reset_index(drop=True)
+            picks['Timeframe'] = label
             
-            # Mid-term: Best Weekly % with positive Monthly % confirmation
-            # Look for sustained momentum over weeks
-            mid_term_candidates = category_df[
-                (category_df['Weekly %'] > 0) & 
-                (category_df['Monthly %'] > 0)
-            ].nlargest(1, 'Weekly %')[['Asset', 'Name', 'Unit', 'Price', 'Weekly %', 'Monthly %', 'Date']].copy()
-            if not mid_term_candidates.empty:
-                mid_term_candidates['Timeframe'] = 'Mid-term'
-                opportunities['mid_term'].append(mid_term_candidates)
+            # Add overall rank
+            picks.insert(0, 'Rank', np.arange(1, len(picks) + 1))
             
-            # Long-term: Best Yearly % with positive Monthly % confirmation
-            # Look for strong long-term trends
-            long_term_candidates = category_df[
-                (category_df['Yearly %'] > 0) & 
-                (category_df['Monthly %'] > 0)
-            ].nlargest(1, 'Yearly %')[['Asset', 'Name', 'Unit', 'Price', 'Monthly %', 'Yearly %', 'Date']].copy()
-            if not long_term_candidates.empty:
-                long_term_candidates['Timeframe'] = 'Long-term'
-                opportunities['long_term'].append(long_term_candidates)
-        
-        # Combine results for each timeframe
-        result = {}
-        for timeframe, frames in opportunities.items():
-            if frames:
-                combined = pd.concat(frames, ignore_index=True)
-                
-                # Add overall rank
-                combined.insert(0, 'Rank', range(1, len(combined) + 1))
-                
-                # Add rank within asset category
-                combined['Rank_Asset'] = combined.groupby('Asset').cumcount() + 1
-                combined.insert(1, 'Rank_Asset', combined.pop('Rank_Asset'))
-                
-                result[timeframe] = combined
-            else:
-                result[timeframe] = pd.DataFrame()
+            # Add rank within asset category
+            picks['Rank_Asset'] = picks.groupby('Asset', observed=True).cumcount() + 1
+            picks.insert(1, 'Rank_Asset', picks.pop('Rank_Asset'))
+            
+            result[timeframe] = picks
         
         return result
     
     def export_to_csv(self, filename: str = 'commodities_data.csv'):
         """Export data to CSV file"""
         self.df.to_csv(filename, index=False)
-        print(f"Data exported to {filename}")
+        logger.info("Data exported to %s", filename)
+
+
+# INSERT statements for the daily tables, defined once and reused by DatabaseManager
+COMMODITIES_INSERT_SQL = """
+    INSERT INTO trd_commodities_daily 
+    (date, asset, name, unit, price, change_value, daily_pct, weekly_pct, 
+     monthly_pct, yearly_pct, three_year_pct, update_date)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+STRONG_LEADS_INSERT_SQL = """
+    INSERT INTO trd_strong_leads_daily 
+    (date, ranking, rank_asset, asset, name, unit, price, daily_pct, weekly_pct,
+     monthly_pct, yearly_pct, match_info, update_date)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+INVESTMENT_OPPORTUNITIES_INSERT_SQL = """
+    INSERT INTO trd_investment_opportunities_daily 
+    (date, timeframe, ranking, rank_asset, asset, name, unit, price,
+     daily_pct, weekly_pct, monthly_pct, yearly_pct, update_date)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
 
 
 class DatabaseManager:
@@ -442,6 +470,7 @@ class DatabaseManager:
         self.password = password
         self.database = database
         self.connection = None
+        self.engine = None
     
     def connect(self):
         """Establish database connection"""
@@ -453,10 +482,10 @@ class DatabaseManager:
                 database=self.database
             )
             if self.connection.is_connected():
-                print(f"Successfully connected to MySQL database: {self.database}")
+                logger.info("Successfully connected to MySQL database: %s", self.database)
                 return True
         except Error as e:
-            print(f"Error connecting to MySQL: {e}")
+            logger.error("Error connecting to MySQL: %s", e)
             return False
     
     def create_database(self):
@@ -471,10 +500,10 @@ class DatabaseManager:
             cursor.execute(f"CREATE DATABASE IF NOT EXISTS {self.database}")
             cursor.close()
             connection.close()
-            print(f"Database {self.database} ready")
+            logger.info("Database %s ready", self.database)
             return True
         except Error as e:
-            print(f"Error creating database: {e}")
+            logger.error("Error creating database: %s", e)
             return False
     
     def create_tables(self):
@@ -503,10 +532,22 @@ class DatabaseManager:
                     update_date VARCHAR(20),
                     INDEX idx_date (date),
                     INDEX idx_asset_name (asset, name),
-                    INDEX idx_name (name)
+                    INDEX idx_name (name),
+                    INDEX idx_name_asset_date (name, asset, date)
                 )
             """)
             
+            # Tables created before idx_name_asset_date existed need it added;
+            # it backs the alert service's previous-day lookup
+            try:
+                cursor.execute("""
+                    CREATE INDEX idx_name_asset_date
+                    ON trd_commodities_daily (name, asset, date)
+                """)
+            except Error as e:
+                if e.errno != errorcode.ER_DUP_KEYNAME:
+                    raise
+            
             # Table 2: Strong leads tracking
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS trd_strong_leads_daily (
@@ -554,10 +595,10 @@ class DatabaseManager:
             """)
             
             cursor.close()
-            print("Database tables created successfully")
+            logger.info("Database tables created successfully")
             return True
         except Error as e:
-            print(f"Error creating tables: {e}")
+            logger.error("Error creating tables: %s", e)
             return False
     
     def save_commodities(self, df: pd.DataFrame, current_date: date):
@@ -568,24 +609,21 @@ class DatabaseManager:
         try:
             cursor = self.connection.cursor()
             
-            for _, row in df.iterrows():
-                cursor.execute("""
-                    INSERT INTO trd_commodities_daily 
-                    (date, asset, name, unit, price, change_value, daily_pct, weekly_pct, 
-                     monthly_pct, yearly_pct, three_year_pct, update_date)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    current_date, row['Asset'], row['Name'], row['Unit'], row['Price'],
-                    row['Change'], row['Daily %'], row['Weekly %'], row['Monthly %'],
-                    row['Yearly %'], row['3-Year %'], row['Date']
-                ))
+            rows = [
+                (current_date,) + row
+                for row in self._row_tuples(df, [
+                    'Asset', 'Name', 'Unit', 'Price', 'Change', 'Daily %', 'Weekly %',
+                    'Monthly %', 'Yearly %', '3-Year %', 'Date'
+                ])
+            ]
+            cursor.executemany(COMMODITIES_INSERT_SQL, rows)
             
             self.connection.commit()
             cursor.close()
-            print(f"Saved {len(df)} commodities records for {current_date}")
+            logger.info("Saved %d commodities records for %s", len(df), current_date)
             return True
         except Error as e:
-            print(f"Error saving commodities: {e}")
+            logger.error("Error saving commodities: %s", e)
             return False
     
     def save_strong_leads(self, df: pd.DataFrame, current_date: date):
@@ -596,24 +634,21 @@ class DatabaseManager:
         try:
             cursor = self.connection.cursor()
             
-            for _, row in df.iterrows():
-                cursor.execute("""
-                    INSERT INTO trd_strong_leads_daily 
-                    (date, ranking, rank_asset, asset, name, unit, price, daily_pct, weekly_pct,
-                     monthly_pct, yearly_pct, match_info, update_date)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    current_date, row['Rank'], row['Rank_Asset'], row['Asset'], row['Name'],
-                    row['Unit'], row['Price'], row['Daily %'], row['Weekly %'],
-                    row['Monthly %'], row['Yearly %'], row['Match'], row['Date']
-                ))
+            rows = [
+                (current_date,) + row
+                for row in self._row_tuples(df, [
+                    'Rank', 'Rank_Asset', 'Asset', 'Name', 'Unit', 'Price', 'Daily %',
+                    'Weekly %', 'Monthly %', 'Yearly %', 'Match', 'Date'
+                ])
+            ]
+            cursor.executemany(STRONG_LEADS_INSERT_SQL, rows)
             
             self.connection.commit()
             cursor.close()
-            print(f"Saved {len(df)} strong leads records for {current_date}")
+            logger.info("Saved %d strong leads records for %s", len(df), current_date)
             return True
         except Error as e:
-            print(f"Error saving strong leads: {e}")
+            logger.error("Error saving strong leads: %s", e)
             return False
     
     def save_investment_opportunities(self, opportunities: Dict[str, pd.DataFrame], current_date: date):
@@ -623,45 +658,59 @@ class DatabaseManager:
         
         try:
             cursor = self.connection.cursor()
-            total_saved = 0
+            rows = []
             
             for timeframe, df in opportunities.items():
                 if df.empty:
                     continue
                 
-                for _, row in df.iterrows():
-                    # Get the appropriate percentage columns based on timeframe
-                    daily_pct = row.get('Daily %', None)
-                    weekly_pct = row.get('Weekly %', None)
-                    monthly_pct = row.get('Monthly %', None)
-                    yearly_pct = row.get('Yearly %', None)
-                    
-                    cursor.execute("""
-                        INSERT INTO trd_investment_opportunities_daily 
-                        (date, timeframe, ranking, rank_asset, asset, name, unit, price,
-                         daily_pct, weekly_pct, monthly_pct, yearly_pct, update_date)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """, (
-                        current_date, timeframe, row['Rank'], row['Rank_Asset'], row['Asset'],
-                        row['Name'], row['Unit'], row['Price'], daily_pct, weekly_pct,
-                        monthly_pct, yearly_pct, row['Date']
-                    ))
-                    total_saved += 1
+                # Percentage columns differ per timeframe; missing ones are saved as NULL
+                rows.extend(
+                    (current_date, timeframe) + row
+                    for row in self._row_tuples(df, [
+                        'Rank', 'Rank_Asset', 'Asset', 'Name', 'Unit', 'Price', 'Daily %',
+                        'Weekly %', 'Monthly %', 'Yearly %', 'Date'
+                    ])
+                )
+            
+            if rows:
+                cursor.executemany(INVESTMENT_OPPORTUNITIES_INSERT_SQL, rows)
+            total_saved = len(rows)
             
             self.connection.commit()
             cursor.close()
-            print(f"Saved {total_saved} investment opportunity records for {current_date}")
+            logger.info("Saved %d investment opportunity records for %s", total_saved, current_date)
             return True
         except Error as e:
-            print(f"Error saving investment opportunities: {e}")
+            logger.error("Error saving investment opportunities: %s", e)
             return False
     
+    @staticmethod
+    def _row_tuples(df: pd.DataFrame, columns: List[str]) -> List[tuple]:
+        """Build one parameter tuple per row, using None for columns missing from df"""
+        values = [df[col].tolist() if col in df.columns else [None] * len(df) for col in columns]
+        return list(zip(*values))
+    
     def get_ranking_changes(self, current_date: date, previous_days: int = 1) -> pd.DataFrame:
         """Get ranking changes compared to previous day(s)"""
         if not self.connection or not self.connection.is_connected():
             return pd.DataFrame()
         
         try:
+            # pandas reads go through SQLAlchemy so results are fetched natively and typed;
+            # the engine is only built here, its one user
+            if self.engine is None:
+                self.engine = create_engine(
+                    URL.create(
+                        'mysql+mysqlconnector',
+                        username=self.user,
+                        password=self.password,
+                        host=self.host,
+                        database=self.database
+                    ),
+                    pool_pre_ping=True
+                )
+            
             query = """
                 SELECT 
                     t.name,
@@ -674,25 +723,28 @@ class DatabaseManager:
                     t.match_info as current_match
                 FROM trd_strong_leads_daily t
                 LEFT JOIN trd_strong_leads_daily p ON t.name = p.name AND t.asset = p.asset
-                    AND p.date = DATE_SUB(%s, INTERVAL %s DAY)
+                    AND p.date = %s
                 WHERE t.date = %s
                 ORDER BY ABS(p.ranking - t.ranking) DESC
             """
             
-            df = pd.read_sql(query, self.connection, params=(current_date, previous_days, current_date))
+            df = pd.read_sql(query, self.engine, params=(current_date - timedelta(days=previous_days), current_date))
             return df
-        except Error as e:
-            print(f"Error getting ranking changes: {e}")
+        except (Error, SQLAlchemyError) as e:
+            logger.error("Error getting ranking changes: %s", e)
             return pd.DataFrame()
     
     def close(self):
         """Close database connection"""
+        if self.engine is not None:
+            self.engine.dispose()
+            self.engine = None
         if self.connection and self.connection.is_connected():
             self.connection.close()
-            print("MySQL connection closed")
+            logger.info("MySQL connection closed")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PriceAlert:
     """Data class for price change alerts"""
     commodity_name: str
@@ -713,68 +765,143 @@ class NotificationChannel(ABC):
     def send(self, alert: PriceAlert, recipient: str) -> bool:
         """Send notification through this channel"""
         pass
+    
+    def send_batch(self, alerts: List[PriceAlert], recipient: str) -> int:
+        """Send several alerts to one recipient and return how many were delivered
+        (one send per alert by default)
+        """
+        return sum(1 for alert in alerts if self.send(alert, recipient))
+    
+    def open(self):
+        """Acquire resources needed for sending (no-op by default)"""
+        pass
+    
+    def close(self):
+        """Release resources held by the channel (no-op by default)"""
+        pass
 
 
-class EmailNotification(NotificationChannel):
-    """Email notification implementation"""
+class SMTPChannel(NotificationChannel):
+    """Base class for channels that deliver through a reusable SMTP session"""
     
     def __init__(self, smtp_server: str, smtp_port: int, sender_email: str, sender_password: str):
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
         self.sender_email = sender_email
         self.sender_password = sender_password
+        self._smtp: Optional[smtplib.SMTP] = None
+    
+    def open(self):
+        """Connect, start TLS and log in, unless a session is already open"""
+        if self._smtp is not None:
+            return
+        
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+    
+    def close(self):
+        """Quit the SMTP session if one is open"""
+        if self._smtp is None:
+            return
+        
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._reset()
+        self._smtp = None
+    
+    def _reset(self):
+        """Drop the session without talking to the server, so the next open() starts clean"""
+        server, self._smtp = self._smtp, None
+        try:
+            server.close()
+        except OSError:
+            pass
+    
+    def _deliver(self, message):
+        """Send a message over the shared session, reconnecting first if the server dropped it"""
+        if self._smtp is not None:
+            # Probe the idle session before handing over the message: a session the server
+            # closed is only replaced here, so a failed send is never retried (and never duplicated)
+            try:
+                code, _ = self._smtp.noop()
+            except (smtplib.SMTPServerDisconnected, OSError):
+                code = None
+            if code != 250:
+                self._reset()
+        self.open()
+        self._smtp.send_message(message)
+
+
+class EmailNotification(SMTPChannel):
+    """Email notification implementation"""
+    
+    # Constant digest body pieces around the per-alert sections
+    BODY_HEADER = "Commodity Price Alert\n=====================\n"
+    BODY_FOOTER = "\nThis is an automated alert from your Commodities Tracker.\n"
     
     def send(self, alert: PriceAlert, recipient: str) -> bool:
         """Send email notification"""
+        return self.send_batch([alert], recipient) == 1
+    
+    def send_batch(self, alerts: List[PriceAlert], recipient: str) -> int:
+        """Send all alerts for a recipient as a single digest email"""
+        names = ', '.join(alert.commodity_name for alert in alerts)
         try:
-            subject = f"Price Alert: {alert.commodity_name} - {alert.percent_change:+.2f}%"
-            
-            body = f"""
-            Commodity Price Alert
-            =====================
-            
-            Commodity: {alert.commodity_name}
-            Asset Type: {alert.asset_type}
-            
-            Current Price: {alert.current_price:.2f} {alert.asset_type}
-            Previous Price: {alert.previous_price:.2f}
-            Price Change: {alert.price_change:+.2f} ({alert.percent_change:+.2f}%)
-            
-            Performance:
-            - Daily: {alert.daily_pct:+.2f}%
-            - Weekly: {alert.weekly_pct:+.2f}%
-            
-            Date: {alert.date}
+            if len(alerts) == 1:
+                subject = f"Price Alert: {alerts[0].commodity_name} - {alerts[0].percent_change:+.2f}%"
+            else:
+                subject = f"Price Alerts: {len(alerts)} commodities"
             
-            This is an automated alert from your Commodities Tracker.
-            """
+            body = "".join([self.BODY_HEADER, *map(self._format_alert, alerts), self.BODY_FOOTER])
             
-            message = MIMEMultipart()
+            # The body is a single plain-text part, so no multipart container is needed
+            message = MIMEText(body, 'plain')
             message['From'] = self.sender_email
             message['To'] = recipient
             message['Subject'] = subject
-            message.attach(MIMEText(body, 'plain'))
             
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(message)
+            self._deliver(message)
             
-            print(f"Email sent to {recipient} for {alert.commodity_name}")
-            return True
+            logger.info("Email sent to %s for %s", recipient, names)
+            return len(alerts)
         except Exception as e:
-            print(f"Error sending email to {recipient}: {e}")
-            return False
+            logger.error("Error sending email to %s: %s", recipient, e)
+            return 0
+    
+    @staticmethod
+    def _format_alert(alert: PriceAlert) -> str:
+        """Format one alert as a section of the email body"""
+        return (
+            f"\nCommodity: {alert.commodity_name}\n"
+            f"Asset Type: {alert.asset_type}\n"
+            f"\n"
+            f"Current Price: {alert.current_price:.2f} {alert.asset_type}\n"
+            f"Previous Price: {alert.previous_price:.2f}\n"
+            f"Price Change: {alert.price_change:+.2f} ({alert.percent_change:+.2f}%)\n"
+            f"\n"
+            f"Performance:\n"
+            f"- Daily: {alert.daily_pct:+.2f}%\n"
+            f"- Weekly: {alert.weekly_pct:+.2f}%\n"
+            f"\n"
+            f"Date: {alert.date}\n"
+        )
 
 
-class SMSNotification(NotificationChannel):
+class SMSNotification(SMTPChannel):
     """SMS notification implementation (using email-to-SMS gateway)"""
     
+    # Messages longer than this are split by carriers, so digests are packed up to it
+    MAX_SMS_LENGTH = 160
+    
     def __init__(self, smtp_server: str, smtp_port: int, sender_email: str, sender_password: str):
-        self.smtp_server = smtp_server
-        self.smtp_port = smtp_port
-        self.sender_email = sender_email
-        self.sender_password = sender_password
+        super().__init__(smtp_server, smtp_port, sender_email, sender_password)
         
         # Common carrier SMS gateways
         self.carrier_gateways = {
@@ -789,33 +916,54 @@ class SMSNotification(NotificationChannel):
     
     def send(self, alert: PriceAlert, recipient: str) -> bool:
         """Send SMS notification via email-to-SMS gateway"""
+        return self.send_batch([alert], recipient) == 1
+    
+    def send_batch(self, alerts: List[PriceAlert], recipient: str) -> int:
+        """Send alerts for a recipient, packing as many lines per SMS as fit,
+        and return how many alerts went out before any failure
+        """
+        delivered = 0
         try:
-            # Short SMS message (160 chars limit consideration)
-            body = f"{alert.commodity_name} Alert: ${alert.current_price:.2f} ({alert.percent_change:+.2f}%) Daily:{alert.daily_pct:+.2f}% Weekly:{alert.weekly_pct:+.2f}%"
-            
-            message = MIMEText(body)
-            message['From'] = self.sender_email
-            message['To'] = recipient
+            # Message bodies paired with the number of alerts packed into each
+            bodies = []
+            for line in map(self._format_alert, alerts):
+                if bodies and len(bodies[-1][0]) + 1 + len(line) <= self.MAX_SMS_LENGTH:
+                    bodies[-1][0] += '\n' + line
+                    bodies[-1][1] += 1
+                else:
+                    bodies.append([line, 1])
             
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(message)
+            for body, count in bodies:
+                message = MIMEText(body)
+                message['From'] = self.sender_email
+                message['To'] = recipient
+                self._deliver(message)
+                delivered += count
             
-            print(f"SMS sent to {recipient} for {alert.commodity_name}")
-            return True
+            logger.info("SMS sent to %s for %s", recipient, ', '.join(alert.commodity_name for alert in alerts))
         except Exception as e:
-            print(f"Error sending SMS to {recipient}: {e}")
-            return False
+            logger.error("Error sending SMS to %s: %s (delivered before failure: %s)", recipient, e,
+                         ', '.join(alert.commodity_name for alert in alerts[:delivered]) or 'none')
+        return delivered
+    
+    @staticmethod
+    def _format_alert(alert: PriceAlert) -> str:
+        """Format one alert as a short SMS line"""
+        return f"{alert.commodity_name} Alert: ${alert.current_price:.2f} ({alert.percent_change:+.2f}%) Daily:{alert.daily_pct:+.2f}% Weekly:{alert.weekly_pct:+.2f}%"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Subscription:
     """Subscription configuration for price alerts"""
     commodity_name: str
     email: Optional[str] = None
     sms_number: Optional[str] = None  # Format: phone@carrier.com (e.g., 5551234567@vtext.com)
     min_percent_change: float = 1.0  # Alert if change >= this percentage
+    commodity_name_lc: str = field(init=False, repr=False)  # Lowercased once for matching
+    
+    def __post_init__(self):
+        # Frozen instances only allow setting derived fields through object.__setattr__
+        object.__setattr__(self, 'commodity_name_lc', self.commodity_name.lower())
 
 
 class AlertService:
@@ -824,11 +972,28 @@ class AlertService:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
         self.notification_channels: List[NotificationChannel] = []
+        self.email_channels: List[EmailNotification] = []
+        self.sms_channels: List[SMSNotification] = []
         self.subscriptions: List[Subscription] = []
+        
+        # Previous-day rows by (name, asset), valid for _prev_cache_date only. Misses are
+        # not cached, so rows backfilled later are picked up on the next check
+        self._prev_cache: Dict[tuple, Dict] = {}
+        self._prev_cache_date: Optional[date] = None
     
     def add_notification_channel(self, channel: NotificationChannel):
         """Add a notification channel (email, SMS, etc.)"""
+        # Each channel gets its own sending thread, so the same object registered twice
+        # would share one SMTP session between two threads
+        if any(registered is channel for registered in self.notification_channels):
+            return
         self.notification_channels.append(channel)
+        
+        # Route by type once here so sending needs no per-channel type checks
+        if isinstance(channel, EmailNotification):
+            self.email_channels.append(channel)
+        elif isinstance(channel, SMSNotification):
+            self.sms_channels.append(channel)
     
     def add_subscription(self, subscription: Subscription):
         """Add a commodity subscription"""
@@ -836,80 +1001,140 @@ class AlertService:
     
     def check_and_send_alerts(self, current_data: pd.DataFrame, current_date: date):
         """Check for price changes and send alerts based on subscriptions"""
+        # Previous-day prices all come from the database, so probe it once up front
+        connection = self.db_manager.connection
+        if not connection or not connection.is_connected():
+            logger.error("No database connection - skipping price alerts")
+            return 0
+        
         alerts_sent = 0
         
-        for subscription in self.subscriptions:
-            # Get current data for subscribed commodity
-            current_commodity = current_data[
-                current_data['Name'].str.lower() == subscription.commodity_name.lower()
-            ]
-            
-            if current_commodity.empty:
-                continue
-            
-            current_row = current_commodity.iloc[0]
-            
-            # Get previous day's data from database
-            previous_data = self._get_previous_day_data(
-                subscription.commodity_name, 
-                current_row['Asset'],
-                current_date
+        # Triggered alerts grouped by recipient, so each recipient gets one digest
+        email_digests: Dict[str, List[PriceAlert]] = {}
+        sms_digests: Dict[str, List[PriceAlert]] = {}
+        
+        # Match subscriptions to current rows through a hash index of lowercased
+        # names, keeping the first row for names that appear more than once
+        name_keys = current_data['Name'].str.lower()
+        first_rows = ~name_keys.duplicated()
+        name_index = pd.Index(name_keys[first_rows])
+        hits = name_index.get_indexer([s.commodity_name_lc for s in self.subscriptions])
+        sub_positions = np.flatnonzero(hits >= 0)
+        rows = np.flatnonzero(first_rows.to_numpy())[hits[sub_positions]]
+        
+        # Pull the matched values out as arrays once for positional access
+        names = current_data['Name'].to_numpy(dtype=object)[rows]
+        assets = current_data['Asset'].to_numpy(dtype=object)[rows]
+        prices = current_data['Price'].to_numpy(dtype=float)[rows]
+        daily_pcts = current_data['Daily %'].to_numpy(dtype=float)[rows]
+        weekly_pcts = current_data['Weekly %'].to_numpy(dtype=float)[rows]
+        dates = current_data['Date'].to_numpy(dtype=object)[rows]
+        
+        # Get previous day's data for all matched commodities in one query
+        previous_day = self._preload_previous_day(
+            list(dict.fromkeys(zip(names, assets))),
+            current_date
+        )
+        
+        previous_rows = [previous_day.get(pair) for pair in zip(names, assets)]
+        has_previous = np.array([row is not None for row in previous_rows], dtype=bool)
+        previous_prices = np.array(
+            [row['price'] if row is not None else np.nan for row in previous_rows], dtype=float
+        )
+        thresholds = np.array(
+            [self.subscriptions[position].min_percent_change for position in sub_positions], dtype=float
+        )
+        
+        # Calculate price changes for all matches at once (0% when previous price is zero)
+        price_changes = prices - previous_prices
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percent_changes = np.where(previous_prices != 0, price_changes / previous_prices * 100, 0.0)
+        
+        # Check which alert thresholds are met
+        triggered = has_previous & (np.abs(percent_changes) >= thresholds)
+        
+        for i in np.flatnonzero(~has_previous):
+            logger.info("No previous data for %s - skipping alert", self.subscriptions[sub_positions[i]].commodity_name)
+        
+        for i in np.flatnonzero(triggered):
+            subscription = self.subscriptions[sub_positions[i]]
+            alert = PriceAlert(
+                commodity_name=names[i],
+                asset_type=assets[i],
+                current_price=prices[i],
+                previous_price=previous_prices[i],
+                price_change=price_changes[i],
+                percent_change=percent_changes[i],
+                daily_pct=daily_pcts[i],
+                weekly_pct=weekly_pcts[i],
+                date=dates[i]
             )
             
-            if previous_data is None:
-                print(f"No previous data for {subscription.commodity_name} - skipping alert")
-                continue
-            
-            # Calculate price change
-            price_change = current_row['Price'] - previous_data['price']
-            percent_change = (price_change / previous_data['price']) * 100 if previous_data['price'] != 0 else 0
-            
-            # Check if alert threshold is met
-            if abs(percent_change) >= subscription.min_percent_change:
-                alert = PriceAlert(
-                    commodity_name=current_row['Name'],
-                    asset_type=current_row['Asset'],
-                    current_price=current_row['Price'],
-                    previous_price=previous_data['price'],
-                    price_change=price_change,
-                    percent_change=percent_change,
-                    daily_pct=current_row['Daily %'],
-                    weekly_pct=current_row['Weekly %'],
-                    date=current_row['Date']
-                )
-                
-                # Send notifications through all channels
-                for channel in self.notification_channels:
-                    if subscription.email and isinstance(channel, EmailNotification):
-                        if channel.send(alert, subscription.email):
-                            alerts_sent += 1
-                    
-                    if subscription.sms_number and isinstance(channel, SMSNotification):
-                        if channel.send(alert, subscription.sms_number):
-                            alerts_sent += 1
+            if subscription.email:
+                email_digests.setdefault(subscription.email, []).append(alert)
+            if subscription.sms_number:
+                sms_digests.setdefault(subscription.sms_number, []).append(alert)
+        
+        jobs = [(channel, email_digests) for channel in self.email_channels if email_digests]
+        jobs += [(channel, sms_digests) for channel in self.sms_channels if sms_digests]
+        
+        try:
+            # Channels send concurrently, one thread each; a channel's own digests go out
+            # in sequence because its SMTP session cannot be shared between threads
+            if jobs:
+                with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                    futures = [executor.submit(self._send_digests, channel, digests)
+                               for channel, digests in jobs]
+                    alerts_sent = sum(future.result() for future in futures)
+        finally:
+            # SMTP sessions are reused across the cycle and released once at the end
+            for channel in self.notification_channels:
+                channel.close()
         
         return alerts_sent
     
-    def _get_previous_day_data(self, commodity_name: str, asset_type: str, current_date: date) -> Optional[Dict]:
-        """Retrieve previous day's price from database"""
-        if not self.db_manager.connection or not self.db_manager.connection.is_connected():
-            return None
+    @staticmethod
+    def _send_digests(channel: NotificationChannel, digests: Dict[str, List[PriceAlert]]) -> int:
+        """Send each recipient's digest through one channel and count the alerts delivered"""
+        alerts_sent = 0
+        for recipient, alerts in digests.items():
+            alerts_sent += channel.send_batch(alerts, recipient)
+        return alerts_sent
+    
+    def _preload_previous_day(self, names_assets: List[tuple], current_date: date) -> Dict[tuple, Dict]:
+        """Retrieve previous day's prices for all (name, asset) pairs, querying only uncached ones.
+        The caller is expected to have checked the database connection.
+        """
+        if current_date != self._prev_cache_date:
+            self._prev_cache = {}
+            self._prev_cache_date = current_date
         
-        try:
-            cursor = self.db_manager.connection.cursor(dictionary=True)
-            query = """
-                SELECT price, daily_pct, weekly_pct
-                FROM commodities_daily
-                WHERE name = %s AND asset = %s AND date = DATE_SUB(%s, INTERVAL 1 DAY)
-                LIMIT 1
-            """
-            cursor.execute(query, (commodity_name, asset_type, current_date))
-            result = cursor.fetchone()
-            cursor.close()
-            return result
-        except Error as e:
-            print(f"Error retrieving previous data: {e}")
-            return None
+        missing = [pair for pair in names_assets if pair not in self._prev_cache]
+        if missing:
+            try:
+                cursor = self.db_manager.connection.cursor(dictionary=True)
+                placeholders = ', '.join(['(%s, %s)'] * len(missing))
+                query = f"""
+                    SELECT name, asset, price, daily_pct, weekly_pct
+                    FROM trd_commodities_daily
+                    WHERE (name, asset) IN ({placeholders}) AND date = %s
+                """
+                params = [value for pair in missing for value in pair]
+                params.append(current_date - timedelta(days=1))
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+                cursor.close()
+                
+                for row in rows:
+                    if row['price'] is None:
+                        continue
+                    # DECIMAL columns come back as Decimal, which does not mix with float prices
+                    row['price'] = float(row['price'])
+                    self._prev_cache.setdefault((row['name'], row['asset']), row)
+            except Error as e:
+                logger.error("Error retrieving previous data: %s", e)
+        
+        return {pair: self._prev_cache[pair] for pair in names_assets if pair in self._prev_cache}
 
 
 class CommoditiesApp:
@@ -922,22 +1147,22 @@ class CommoditiesApp:
     
     def run(self):
         """Execute the scraping and parsing process"""
-        print("Fetching data from Trading Economics...")
+        logger.info("Fetching data from Trading Economics...")
         html = self.scraper.fetch_page()
         
         if not html:
-            print("Failed to fetch data.")
+            logger.error("Failed to fetch data.")
             return
         
-        print("Parsing commodities tables...")
+        logger.info("Parsing commodities tables...")
         parser = TableParser(html)
         commodities = parser.parse_tables()
         
         if not commodities:
-            print("No commodities data found.")
+            logger.warning("No commodities data found.")
             return
         
-        print(f"Successfully parsed {len(commodities)} commodities.")
+        logger.info("Successfully parsed %d commodities.", len(commodities))
         
         self.data_manager = CommodityDataManager(commodities)
         return self.data_manager
@@ -960,7 +1185,7 @@ def load_db_credentials(filepath: str = 'DBcredentials.txt') -> dict:
                 'database': lines[2] if len(lines) > 2 else 'tradeview'
             }
     except FileNotFoundError:
-        print(f"Warning: {filepath} not found. Using default credentials.")
+        logger.warning("Warning: %s not found. Using default credentials.", filepath)
         return {
             'host': 'localhost',
             'user': 'root',
@@ -970,6 +1195,13 @@ def load_db_credentials(filepath: str = 'DBcredentials.txt') -> dict:
 
 def main():
     """Main entry point"""
+    # Status messages go to stdout alongside the report so their order is kept. Only this
+    # module's logger is set up, so other libraries keep their own (quieter) levels
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    
     # Read URL from file
     url = "https://tradingeconomics.com/commodities"
     
@@ -998,6 +1230,7 @@ def main():
     # Create and run the application
     app = CommoditiesApp(url)
     data_manager = app.run()
+    app.scraper.close()
     
     if data_manager:
         # Display summary and columns
@@ -10,10 +10,6 @@ echo.
 echo Installing requests...
 pip install requests>=2.31.0
 
-echo.
-echo Installing beautifulsoup4...
-pip install beautifulsoup4>=4.12.0
-
 echo.
 echo Installing pandas (this may take a moment)...
 pip install pandas==2.1.4 --only-binary=:all:
@@ -26,6 +22,10 @@ echo.
 echo Installing mysql-connector-python...
 pip install mysql-connector-python>=8.0.0
 
+echo.
+echo Installing SQLAlchemy...
+pip install sqlalchemy>=2.0
+
 echo.
 echo ========================================
 echo Installation complete!
@@ -35,8 +35,8 @@ echo Verifying installation...
 python -c "import pandas; print('pandas version:', pandas.__version__)"
 python -c "import mysql.connector; print('MySQL connector: OK')"
 python -c "import requests; print('requests: OK')"
-python -c "import bs4; print('beautifulsoup4: OK')"
 python -c "import lxml; print('lxml: OK')"
+python -c "import sqlalchemy; print('SQLAlchemy: OK')"
 
 echo.
 echo All packages installed successfully!